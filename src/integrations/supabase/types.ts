@@ -177,7 +177,15 @@ export type Database = {
       }
     }
     Views: {
-      [_ in never]: never
+      radio_stations_monitor: {
+        Row: {
+          id: string | null
+          name: string | null
+          scrape_url: string | null
+          tipo: string | null
+        }
+        Relationships: []
+      }
     }
     Functions: {
       cleanup_excess_scraped_songs: { Args: never; Returns: undefined }
@@ -0,0 +1,31 @@
+-- 1. Índice de desduplicação para radio_historico (alinhado com o trigger abaixo)
+CREATE INDEX IF NOT EXISTS idx_radio_historico_dedup
+ON public.radio_historico (station_name, lower(trim(artist)), lower(trim(title)), captured_at DESC);
+
+-- 2. Descarta no servidor a mesma música da mesma estação capturada na última hora
+--    (o monitor envia em lote e não precisa mais consultar antes de inserir)
+CREATE OR REPLACE FUNCTION public.prevent_duplicate_historico()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path TO 'public'
+AS $function$
+BEGIN
+  IF EXISTS(
+    SELECT 1 FROM radio_historico
+    WHERE station_name = NEW.station_name
+      AND lower(trim(artist)) = lower(trim(NEW.artist))
+      AND lower(trim(title)) = lower(trim(NEW.title))
+      AND captured_at > (NOW() - INTERVAL '1 hour')
+  ) THEN
+    RETURN NULL;
+  END IF;
+  RETURN NEW;
+END;
+$function$;
+
+DROP TRIGGER IF EXISTS prevent_duplicate_historico ON public.radio_historico;
+CREATE TRIGGER prevent_duplicate_historico
+BEFORE INSERT ON public.radio_historico
+FOR EACH ROW
+EXECUTE FUNCTION public.prevent_duplicate_historico();
@@ -0,0 +1,11 @@
+-- Lista de emissoras do monitor Python: só as colunas usadas e o tipo de extrator já resolvido
+-- (mesma regra do TIPOS_POR_URL em public/radio_monitor_supabase.py)
+CREATE OR REPLACE VIEW public.radio_stations_monitor
+WITH (security_invoker = true) AS
+SELECT
+  id,
+  name,
+  scrape_url,
+  CASE WHEN scrape_url ILIKE '%clubefm%' THEN 'clubefm' ELSE 'mytuner' END AS tipo
+FROM public.radio_stations
+WHERE enabled = true;
@@ -0,0 +1,44 @@
+-- Limpeza do radio_historico uma vez por INSERT (lote do monitor), e não a cada linha
+-- O trigger por linha sorteava 10% das linhas e recontava a estação inteira a cada uma delas;
+-- agora um único DELETE por comando cobre só as estações presentes no lote (mantém as 150 mais recentes)
+CREATE OR REPLACE FUNCTION public.cleanup_radio_historico_lote()
+RETURNS trigger
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path TO 'public'
+AS $function$
+BEGIN
+  DELETE FROM radio_historico
+  WHERE id IN (
+    SELECT id FROM (
+      SELECT id, ROW_NUMBER() OVER (PARTITION BY station_name ORDER BY captured_at DESC) AS rn
+      FROM radio_historico
+      WHERE station_name IN (SELECT DISTINCT station_name FROM novas)
+    ) ranked
+    WHERE rn > 150
+  );
+  RETURN NULL;
+END;
+$function$;
+
+-- Remove o(s) trigger(s) por linha que chamam cleanup_radio_historico (criados fora das migrações)
+DO $$
+DECLARE
+  t record;
+BEGIN
+  FOR t IN
+    SELECT tgname FROM pg_trigger
+    WHERE tgrelid = 'public.radio_historico'::regclass
+      AND tgfoid = 'public.cleanup_radio_historico()'::regprocedure
+      AND NOT tgisinternal
+  LOOP
+    EXECUTE format('DROP TRIGGER %I ON public.radio_historico', t.tgname);
+  END LOOP;
+END $$;
+
+DROP TRIGGER IF EXISTS cleanup_radio_historico_lote ON public.radio_historico;
+CREATE TRIGGER cleanup_radio_historico_lote
+AFTER INSERT ON public.radio_historico
+REFERENCING NEW TABLE AS novas
+FOR EACH STATEMENT
+EXECUTE FUNCTION public.cleanup_radio_historico_lote();